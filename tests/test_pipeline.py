@@ -1,8 +1,11 @@
+import os
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
-from births_pipeline import RATE_SCALE, main
+import births_pipeline
+from births_pipeline import RATE_SCALE, calculate_birth_rate, calculate_births, load_data, main
 
 
 YEAR = 2024
@@ -26,3 +29,179 @@ def test_main_pipeline_produces_outputs(tmp_path: Path) -> None:
         csv_file = tmp_path / f"{YEAR}_{key}.csv"
         assert csv_file.exists()
         assert csv_file.stat().st_size > 0
+
+
+def test_calculate_births_handles_missing_values() -> None:
+    births = pd.DataFrame(
+        {
+            "year": [YEAR] * 6,
+            "birth_type": [
+                "Live birth", "Stillbirth", None, "Live birth", "Stillbirth", "Live birth"
+            ],
+            "sex": ["Female", None, "Male", "Male", "Female", "Female"],
+            "region": ["RegionA", "RegionA", "RegionB", None, "RegionB", "RegionA"],
+        }
+    )
+    aggs = calculate_births(births)
+
+    totals = aggs["totals"].iloc[0]
+    assert (totals["live_births"], totals["still_births"]) == (3, 2)
+
+    # Missing sex stays its own group; a missing birth_type is neither live nor still
+    by_sex = aggs["by_sex"]
+    missing_sex = by_sex[by_sex["sex"].isna()]
+    assert missing_sex[["live_births", "still_births"]].values.tolist() == [[0, 1]]
+    counts = by_sex.dropna(subset=["sex"]).set_index("sex")
+    assert counts.loc["Female", ["live_births", "still_births"]].tolist() == [2, 1]
+    assert counts.loc["Male", ["live_births", "still_births"]].tolist() == [1, 0]
+
+    # Missing region is reported as "Unknown"
+    by_region = aggs["by_region"].set_index("region")
+    assert by_region.loc["Unknown", ["live_births", "still_births"]].tolist() == [1, 0]
+
+    assert len(aggs["by_sex_region"]) == 5
+
+
+@pytest.mark.skipif(not births_pipeline.HAS_NUMBA, reason="numba not installed")
+def test_numba_kernel_matches_bincount(monkeypatch: pytest.MonkeyPatch) -> None:
+    births, _ = load_data(YEAR)
+    births.loc[::7, "sex"] = None
+    births.loc[::11, "birth_type"] = None
+
+    monkeypatch.setattr(births_pipeline, "NUMBA_MIN_ROWS", len(births) + 1)
+    expected = calculate_births(births)
+    monkeypatch.setattr(births_pipeline, "NUMBA_MIN_ROWS", 0)
+    result = calculate_births(births)
+
+    assert set(result) == set(expected)
+    for key in expected:
+        pd.testing.assert_frame_equal(result[key], expected[key])
+
+
+@pytest.mark.skipif(not births_pipeline.HAS_NUMEXPR, reason="numexpr not installed")
+def test_numexpr_rates_match_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    births, pop = load_data(YEAR)
+    pop.loc[pop["region"] == pop["region"].iloc[0], "population"] = 0
+
+    monkeypatch.setattr(births_pipeline, "NUMEXPR_MIN_ROWS", 10**9)
+    expected = calculate_birth_rate(calculate_births(births), pop, YEAR)
+    monkeypatch.setattr(births_pipeline, "NUMEXPR_MIN_ROWS", 0)
+    result = calculate_birth_rate(calculate_births(births), pop, YEAR)
+
+    rate_column = f"birth_rate_per_{RATE_SCALE}"
+    assert expected["by_region"][rate_column].isna().any()
+    for key in expected:
+        pd.testing.assert_series_equal(
+            result[key][rate_column], expected[key][rate_column], check_exact=True
+        )
+
+
+def test_population_read_is_cached_across_years() -> None:
+    births_pipeline._read_csv_cached.cache_clear()
+    load_data(2023)
+    load_data(2024)
+
+    # Two births files; the population file is parsed once and reused
+    info = births_pipeline._read_csv_cached.cache_info()
+    assert (info.misses, info.hits) == (3, 1)
+
+
+def test_read_csv_cache_invalidated_by_mtime(tmp_path: Path) -> None:
+    csv_file = tmp_path / "pop.csv"
+    csv_file.write_text("sex,year,population\nFemale,2024,10\n")
+    births_pipeline._read_csv_cached.cache_clear()
+
+    first = births_pipeline._read_csv(csv_file, ["sex", "year", "population"])
+    first.loc[0, "population"] = 0  # callers get a copy, not the cached frame
+    again = births_pipeline._read_csv(csv_file, ["sex", "year", "population"])
+    assert births_pipeline._read_csv_cached.cache_info().hits == 1
+    assert again["population"].tolist() == [10]
+
+    csv_file.write_text("sex,year,population\nFemale,2024,20\n")
+    stat = csv_file.stat()
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    edited = births_pipeline._read_csv(csv_file, ["sex", "year", "population"])
+    assert births_pipeline._read_csv_cached.cache_info().misses == 2
+    assert edited["population"].tolist() == [20]
+
+
+def test_csv_outputs_are_unquoted(tmp_path: Path) -> None:
+    main(YEAR, out_dir=tmp_path)
+    lines = (tmp_path / f"{YEAR}_by_sex.csv").read_text().splitlines()
+    assert lines[0] == f"sex,live_births,still_births,population,birth_rate_per_{RATE_SCALE}"
+    assert not any('"' in line for line in lines)
+
+
+@pytest.mark.skipif(not births_pipeline.HAS_PYARROW, reason="pyarrow not installed")
+def test_main_pipeline_writes_parquet(tmp_path: Path) -> None:
+    outputs = main(YEAR, out_dir=tmp_path, fmt="parquet")
+
+    for key, df in outputs.items():
+        parquet_file = tmp_path / f"{YEAR}_{key}.parquet"
+        assert parquet_file.exists()
+        assert not (tmp_path / f"{YEAR}_{key}.csv").exists()
+        pd.testing.assert_frame_equal(pd.read_parquet(parquet_file), df, check_dtype=False)
+
+
+def test_save_outputs_rejects_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        births_pipeline.save_outputs({}, YEAR, out_dir=tmp_path, fmt="xlsx")
+
+
+def test_outputs_have_plain_string_keys(tmp_path: Path) -> None:
+    outputs = main(YEAR, out_dir=tmp_path)
+
+    key_columns = {"by_sex": ["sex"], "by_region": ["region"], "by_sex_region": ["sex", "region"]}
+    for key, columns in key_columns.items():
+        for column in columns:
+            dtype = outputs[key][column].dtype
+            assert not isinstance(dtype, pd.CategoricalDtype)
+            assert pd.api.types.is_string_dtype(dtype)
+
+
+def test_load_data_keeps_only_requested_population_year(monkeypatch: pytest.MonkeyPatch) -> None:
+    _, pop_df = load_data(YEAR)
+    assert not pop_df.empty
+    assert set(pop_df["year"].tolist()) == {YEAR}
+
+    monkeypatch.setattr(births_pipeline, "HAS_PYARROW", False)
+    _, fallback_pop_df = load_data(YEAR)
+    pd.testing.assert_frame_equal(
+        fallback_pop_df.astype(object), pop_df.astype(object), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "use_pyarrow",
+    [
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not births_pipeline.HAS_PYARROW, reason="pyarrow not installed"
+            ),
+        ),
+        False,
+    ],
+)
+def test_blank_population_cells_count_as_zero(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_pyarrow: bool
+) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    source_dir = births_pipeline.DATA_DIR
+    (data_dir / f"data_{YEAR}.csv").write_bytes((source_dir / f"data_{YEAR}.csv").read_bytes())
+    lines = (source_dir / "pop_data.csv").read_text().splitlines()
+    rows = [i for i, line in enumerate(lines) if line.split(",")[3] == str(YEAR)]
+    blank_population, blank_year = rows[0], rows[1]
+    expected = sum(int(lines[i].split(",")[4]) for i in rows[2:])
+    lines[blank_population] = lines[blank_population].rsplit(",", 1)[0] + ","
+    fields = lines[blank_year].split(",")
+    fields[3] = ""
+    lines[blank_year] = ",".join(fields)
+    (data_dir / "pop_data.csv").write_text("\n".join(lines) + "\n")
+    monkeypatch.setattr(births_pipeline, "DATA_DIR", data_dir)
+    monkeypatch.setattr(births_pipeline, "HAS_PYARROW", use_pyarrow)
+
+    outputs = main(YEAR, out_dir=tmp_path / "outputs")
+
+    assert outputs["by_sex"]["population"].sum() == expected